@@ -27,7 +27,10 @@ Copyright (c) 2025 Kyle Hughes. All rights reserved.
 """
 
 import argparse
+import concurrent.futures
 import dataclasses
+import errno
+import itertools
 import logging
 import os
 import re
@@ -36,8 +39,11 @@ import signal
 import subprocess
 import sys
 import tempfile
+import zipfile
 from pathlib import Path
-from typing import List, Dict, Optional, Any
+from typing import List, Optional, Any, Callable, Set, TypeVar, Union
+
+T = TypeVar('T')
 
 
 # --- Logging Configuration ---
@@ -84,8 +90,58 @@ class Configuration:
         )
 
 
+# --- Filesystem Helpers ---
+
+# os.link errors that mean "hard links aren't possible here", so a real copy is needed
+_LINK_FALLBACK_ERRNOS = {errno.EXDEV, errno.EPERM, errno.ENOTSUP, errno.EOPNOTSUPP, errno.EMLINK}
+
+
+def _fast_copy(src: Union[str, os.PathLike], dst: Union[str, os.PathLike]) -> None:
+    """
+    Copy a file and its metadata, avoiding a userspace round-trip where possible.
+
+    Tries a hard link first, then an in-kernel copy via os.copy_file_range
+    (Linux), and finally falls back to shutil.copy2.
+    """
+    # Replace an existing destination rather than writing through it: it may be
+    # a hard link to a source file, which truncating would destroy
+    if os.path.lexists(dst):
+        os.unlink(dst)
+
+    # Hard links share the inode, so mode and timestamps come along for free
+    try:
+        os.link(src, dst)
+        return
+    except OSError as e:
+        if e.errno not in _LINK_FALLBACK_ERRNOS:
+            raise
+
+    if hasattr(os, 'copy_file_range'):
+        with open(src, 'rb') as fsrc, open(dst, 'xb') as fdst:
+            try:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+                copied_in_kernel = True
+            except OSError:
+                copied_in_kernel = False
+
+        if copied_in_kernel:
+            shutil.copystat(src, dst)
+            return
+
+    shutil.copy2(src, dst)
+
+
 # --- Git Operations ---
 
+# Matches the major and minor version in `git version` output, e.g. "git version 2.39.5"
+_GIT_VERSION_RE = re.compile(r'(\d+)\.(\d+)')
+
+
 class GitRepository:
     """
     Manages a temporary git repository clone.
@@ -93,9 +149,10 @@ class GitRepository:
     Implements the Context Manager protocol for automatic cleanup.
     """
 
-    def __init__(self, url: str, keep_temp: bool = False):
+    def __init__(self, url: str, keep_temp: bool = False, sparse_paths: Optional[List[str]] = None):
         self.url = url
         self.keep_temp = keep_temp
+        self.sparse_paths = sparse_paths
         self._temp_dir: Optional[str] = None
         self.path: Optional[Path] = None
 
@@ -107,21 +164,39 @@ class GitRepository:
         self._cleanup()
 
     def _clone(self) -> None:
-        """Clone the repository to a temporary directory."""
+        """
+        Clone the repository to a temporary directory.
+
+        When sparse_paths is set and git supports it, performs a partial,
+        sparse clone so only blobs under those directories (plus top-level
+        files, such as the license) are downloaded.
+        """
         self._temp_dir = tempfile.mkdtemp(prefix="migration-skill-")
         self.path = Path(self._temp_dir) / "repo"
 
         logger.info(f"Cloning repository from {self.url}...")
 
-        cmd = ["git", "clone", "--depth", "1", self.url, str(self.path)]
-
         try:
-            result = subprocess.run(
-                cmd,
-                check=True,
-                capture_output=True,
-                text=True
-            )
+            if self.sparse_paths and self._supports_sparse_clone():
+                cmds = [
+                    ["git", "clone", "--quiet", "--depth", "1", "--filter=blob:none", "--sparse", self.url, str(self.path)],
+                    # Cone mode, which always includes top-level files such as the
+                    # license, is only the default from git 2.37
+                    ["git", "-C", str(self.path), "sparse-checkout", "init", "--cone"],
+                    ["git", "-C", str(self.path), "sparse-checkout", "set", *self.sparse_paths],
+                ]
+            else:
+                cmds = [["git", "clone", "--quiet", "--depth", "1", self.url, str(self.path)]]
+
+            # Only stderr is captured, for error reporting; stdout is discarded
+            for cmd in cmds:
+                subprocess.run(
+                    cmd,
+                    check=True,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
+                    text=True
+                )
         except subprocess.CalledProcessError as e:
             logger.error(f"Git clone failed: {e.stderr.strip()}")
             self._cleanup()
@@ -132,6 +207,22 @@ class GitRepository:
 
         logger.info("Repository cloned successfully")
 
+    @staticmethod
+    def _supports_sparse_clone() -> bool:
+        """Check whether git supports `clone --sparse` (added in git 2.25)."""
+        result = subprocess.run(
+            ["git", "version"],
+            check=True,
+            capture_output=True,
+            text=True
+        )
+
+        match = _GIT_VERSION_RE.search(result.stdout)
+        if not match:
+            return False
+
+        return (int(match.group(1)), int(match.group(2))) >= (2, 25)
+
     def _cleanup(self) -> None:
         """Remove the temporary directory unless keep_temp is True."""
         if self.keep_temp:
@@ -169,6 +260,41 @@ def sanitize_filename(filename: str) -> str:
     return filename.replace('+', '_')
 
 
+# Matches DocC document references, e.g. <doc:DataRaceSafety>
+_DOC_RE = re.compile(r'<doc:([^>]+)>')
+
+# Line prefixes skipped when looking for a markdown description
+_SKIP_PREFIXES = ('#', '<', '>')
+
+# Swift comment prefixes: MARK/banner comments to skip, and block comment lines
+_SKIP_COMMENT_PREFIXES = ('MARK:', '===')
+_BLOCK_COMMENT_PREFIXES = ('/*', '*')
+
+# Bytes read from the head of a markdown file for the fast metadata path
+_METADATA_HEAD_SIZE = 8192
+
+# Line breaks the fast path's '\n'-only patterns don't handle: a bare '\r', and
+# the other str.splitlines() boundaries the streaming fallback breaks on
+_OTHER_LINE_BREAK_RE = re.compile('\r(?!\n)|[\x0b\x0c\x1c-\x1e\x85\u2028\u2029]')
+
+# An @Directive block, from its opening line through the next line that is just '}'
+_METADATA_BLOCK = r'[^\S\n]*@[^\n]*\n(?:(?![^\S\n]*\}[^\S\n]*(?:\n|\Z))[^\n]*\n)*[^\S\n]*\}[^\S\n]*(?:\n|\Z)'
+
+# Matches the title and description at the start of a markdown file. Mirrors the
+# ContentParser.extract_metadata state machine, but only matches when the outcome
+# is unambiguous; anything else falls through to the state machine.
+_METADATA_RE = re.compile(
+    # Before the title: @Directive blocks, or any line that isn't a title
+    rf'(?:{_METADATA_BLOCK}|(?![^\S\n]*(?:@|# ))[^\n]*\n)*'
+    # Title: first level-1 header
+    r'[^\S\n]*# (?=[^\n]*\S)(?P<title>[^\n]*)\n'
+    # After the title: @Directive blocks, blank lines, headings, and markup
+    rf'(?:{_METADATA_BLOCK}|[^\S\n]*(?:[#<>][^\n]*)?\n)*'
+    # Description: first remaining line of text
+    r'[^\S\n]*(?P<description>[^#<>@\s][^\n]*)\n'
+)
+
+
 class ContentParser:
     """Parses markdown content, extracts metadata, and handles TOC parsing."""
 
@@ -185,7 +311,7 @@ class ContentParser:
 
         content = toc_path.read_text(encoding='utf-8')
         # Extract all document references to build the ordered list
-        return re.findall(r'<doc:([^>]+)>', content)
+        return _DOC_RE.findall(content)
 
     def extract_metadata(self, file_path: Path) -> DocumentMetadata:
         """
@@ -194,9 +320,28 @@ class ContentParser:
         Strategy:
         1. Title: First level-1 header (# Title)
         2. Description: First paragraph of text that isn't metadata or empty.
+
+        A compiled regex over the head of the file handles the common case.
+        The line-by-line state machine is the fallback when it doesn't match.
         """
-        content = file_path.read_text(encoding='utf-8')
-        lines = content.splitlines()
+        # Fast path: match the complete lines at the head of the file in one regex scan
+        with file_path.open('rb') as f:
+            head = f.read(_METADATA_HEAD_SIZE)
+
+        try:
+            text = head[:head.rfind(b'\n') + 1].decode('utf-8')
+        except UnicodeDecodeError:
+            text = ""
+
+        match = None if _OTHER_LINE_BREAK_RE.search(text) else _METADATA_RE.match(text)
+
+        if match:
+            return DocumentMetadata(
+                filename=file_path.name,
+                title=match.group('title').strip(),
+                description=match.group('description').strip(),
+                path=file_path
+            )
 
         title = file_path.stem
         description = ""
@@ -205,38 +350,42 @@ class ContentParser:
         in_metadata_block = False
         found_title = False
 
-        for line in lines:
-            stripped = line.strip()
+        # Stream the file; parsing stops as soon as the description is found.
+        # Each line is split again to keep str.splitlines() boundaries
+        # (form feeds, U+2028, ...) that file iteration doesn't break on.
+        with file_path.open('r', encoding='utf-8') as f:
+            for line in (part for raw_line in f for part in raw_line.splitlines()):
+                stripped = line.strip()
 
-            # Handle Metadata Blocks
-            if stripped.startswith('@'):
-                in_metadata_block = True
-                continue
+                # Handle Metadata Blocks
+                if stripped.startswith('@'):
+                    in_metadata_block = True
+                    continue
 
-            if in_metadata_block:
-                if stripped == '}' or stripped == '':
-                    if stripped == '}':
-                        in_metadata_block = False
+                if in_metadata_block:
+                    if stripped == '}' or stripped == '':
+                        if stripped == '}':
+                            in_metadata_block = False
+                        continue
                     continue
-                continue
 
-            # Skip empty lines
-            if not stripped:
-                continue
+                # Skip empty lines
+                if not stripped:
+                    continue
 
-            # Extract Title
-            if not found_title:
-                if stripped.startswith('# '):
-                    title = stripped[2:].strip()
-                    found_title = True
-                continue
+                # Extract Title
+                if not found_title:
+                    if stripped.startswith('# '):
+                        title = stripped[2:].strip()
+                        found_title = True
+                    continue
 
-            # Extract Description
-            if stripped.startswith('#') or stripped.startswith('<') or stripped.startswith('>'):
-                continue
+                # Extract Description
+                if stripped.startswith(_SKIP_PREFIXES):
+                    continue
 
-            description = stripped
-            break
+                description = stripped
+                break
 
         if not description:
             description = "No description available."
@@ -254,34 +403,34 @@ class ContentParser:
 
         Strategy: Use the first line comment or the filename.
         """
-        content = file_path.read_text(encoding='utf-8')
-        lines = content.splitlines()
-
         description = ""
 
-        for line in lines:
-            stripped = line.strip()
+        # Stream the file; scanning stops at the first line of code.
+        # Each line is split again to keep str.splitlines() boundaries.
+        with file_path.open('r', encoding='utf-8') as f:
+            for line in (part for raw_line in f for part in raw_line.splitlines()):
+                stripped = line.strip()
 
-            # Skip empty lines
-            if not stripped:
-                continue
+                # Skip empty lines
+                if not stripped:
+                    continue
 
-            # Check for single-line comment
-            if stripped.startswith('//'):
-                comment = stripped[2:].strip()
-                # Skip MARK comments and file headers
-                if comment and not comment.startswith('MARK:') and not comment.startswith('==='):
-                    description = comment
+                # Check for single-line comment
+                if stripped.startswith('//'):
+                    comment = stripped[2:].strip()
+                    # Skip MARK comments and file headers
+                    if comment and not comment.startswith(_SKIP_COMMENT_PREFIXES):
+                        description = comment
+                        break
+
+                # Check for doc comment
+                if stripped.startswith('///'):
+                    description = stripped[3:].strip()
                     break
 
-            # Check for doc comment
-            if stripped.startswith('///'):
-                description = stripped[3:].strip()
-                break
-
-            # If we hit actual code, stop looking
-            if not stripped.startswith('/*') and not stripped.startswith('*'):
-                break
+                # If we hit actual code, stop looking
+                if not stripped.startswith(_BLOCK_COMMENT_PREFIXES):
+                    break
 
         if not description:
             # Generate description from filename
@@ -302,11 +451,23 @@ class ContentParser:
         """Get all Swift example files."""
         if not self.examples_root.exists():
             return []
-        return sorted(self.examples_root.glob("*.swift"))
+
+        with os.scandir(self.examples_root) as entries:
+            return sorted(
+                Path(entry.path) for entry in entries
+                if entry.name.endswith('.swift') and entry.is_file()
+            )
 
 
 # --- Skill Generation ---
 
+# Already-compressed formats that gain nothing from deflate
+_PRECOMPRESSED_SUFFIXES = {'.png', '.jpg', '.jpeg', '.gif', '.zip'}
+
+# Swaps square brackets for parentheses so descriptions can't break index links
+_BRACKET_TRANS = str.maketrans({'[': '(', ']': ')'})
+
+
 class SkillGenerator:
     """Orchestrates the creation of the skill directory and artifacts."""
 
@@ -316,31 +477,37 @@ class SkillGenerator:
         self.parser = ContentParser(repo.path)
         self.doc_registry: List[DocumentMetadata] = []
         self.example_registry: List[ExampleMetadata] = []
+        self._archive: Optional[zipfile.ZipFile] = None
 
     def build(self):
         """Main build execution flow."""
         # 1. Analyze Repository
         doc_order = self.parser.parse_toc_order(self.config.TOC_REL_PATH)
 
-        # 2. Prepare Output Directory
+        # 2. Prepare Output Directory and Archive
         if not self.config.dry_run:
             self._prepare_directory()
+            self._open_archive()
 
-        # 3. Process Content
-        self._process_docs(doc_order)
-        self._process_examples()
+        try:
+            # 3. Process Content
+            self._process_docs(doc_order)
+            self._process_examples()
 
-        # Copy License
-        if not self.config.dry_run:
-            self._copy_license()
+            # Copy License
+            if not self.config.dry_run:
+                self._copy_license()
 
-        # 4. Generate Index
-        if not self.config.dry_run:
-            self._generate_skill_md()
+            # 4. Generate Index
+            if not self.config.dry_run:
+                self._generate_skill_md()
+        except BaseException:
+            self._discard_archive()
+            raise
 
-        # 5. Create Zip Archive
+        # 5. Finalize Zip Archive
         if not self.config.dry_run:
-            self._create_zip_archive()
+            self._finalize_archive()
 
         logger.info("Packaging complete")
 
@@ -351,46 +518,107 @@ class SkillGenerator:
 
         self.config.output_path.mkdir(parents=True)
 
-    def _create_zip_archive(self):
-        """Create a zip archive of the skill directory."""
-        zip_path = self.config.output_path.with_suffix('.zip')
+    def _open_archive(self):
+        """
+        Open the zip archive alongside the skill directory.
 
-        shutil.make_archive(
-            str(self.config.output_path),
-            'zip',
-            root_dir=self.config.output_path.parent,
-            base_dir=self.config.output_path.name
-        )
+        Files are added from their sources as they are copied, so the
+        finished skill directory never has to be walked or read back.
+        """
+        # Append rather than replace a suffix, e.g. skill.v2 -> skill.v2.zip
+        zip_path = self.config.output_path.with_name(self.config.output_path.name + '.zip')
+        # Level 1 trades a slightly larger archive for much faster deflate on text
+        self._archive = zipfile.ZipFile(zip_path, 'w', compression=zipfile.ZIP_DEFLATED, compresslevel=1)
+        self._add_to_archive(self.config.output_path, "")
+
+    def _add_to_archive(self, path: Union[str, os.PathLike], rel_path: str):
+        """Add a file or directory to the archive under the skill directory name."""
+        if self._archive is None:
+            return
+
+        arcname = f"{self.config.output_path.name}/{rel_path}" if rel_path else self.config.output_path.name
+        suffix = os.path.splitext(path)[1].lower()
+        compress_type = zipfile.ZIP_STORED if suffix in _PRECOMPRESSED_SUFFIXES else None
+        self._archive.write(path, arcname=arcname, compress_type=compress_type)
+
+    def _finalize_archive(self):
+        """Close the zip archive, completing it."""
+        if self._archive is None:
+            return
+
+        zip_path = self._archive.filename
+        self._archive.close()
+        self._archive = None
         logger.info(f"Archive created: {zip_path}")
 
+    def _discard_archive(self):
+        """Close and delete a partially written zip archive."""
+        if self._archive is None:
+            return
+
+        zip_path = Path(self._archive.filename)
+        self._archive.close()
+        self._archive = None
+        zip_path.unlink(missing_ok=True)
+
+    def _map_concurrently(self, func: Callable[[Path], T], paths: List[Path]) -> List[T]:
+        """
+        Apply func to each path on a thread pool, preserving input order.
+
+        Per-file work is dominated by I/O, which releases the GIL.
+        """
+        if not paths:
+            return []
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(32, len(paths))) as executor:
+            return list(executor.map(func, paths))
+
     def _process_docs(self, doc_order: List[str]):
         """Copy documentation files and extract metadata in TOC order."""
 
-        # Pre-index all available files
-        file_map: Dict[str, Path] = {}
+        # Resolve sources directly from TOC order; no directory scan needed
+        sources: List[Path] = []
+        seen: Set[str] = set()
+        guide_root = os.fspath(self.parser.guide_root)
 
-        for md_file in self.parser.guide_root.glob("*.md"):
-            # Skip the main TOC file
-            if md_file.name == "MigrationGuide.md":
+        for doc_name in doc_order:
+            # Skip the main TOC file, and any reference that isn't a plain name:
+            # only top-level Guide.docc articles are packaged
+            if doc_name == "MigrationGuide" or doc_name in ('.', '..') or os.path.basename(doc_name) != doc_name:
                 continue
-            file_map[md_file.stem] = md_file
 
-        # Process in TOC order
-        for doc_name in doc_order:
-            if doc_name not in file_map:
+            # Skip repeated references, so each article is extracted, copied,
+            # and archived once
+            filename = f"{doc_name}.md"
+            if filename in seen:
                 continue
 
-            source_path = file_map[doc_name]
+            source_path = os.path.join(guide_root, filename)
+            if os.path.isfile(source_path):
+                seen.add(filename)
+                sources.append(Path(source_path))
+
+        # Plain string paths keep Path allocations out of the per-file work
+        dest_dir = os.fspath(self.config.output_path / "Guide")
+        if sources and not self.config.dry_run:
+            os.makedirs(dest_dir, exist_ok=True)
 
+        def process(source_path: Path) -> DocumentMetadata:
             # Extract Metadata
             metadata = self.parser.extract_metadata(source_path)
-            self.doc_registry.append(metadata)
 
             # Copy File
             if not self.config.dry_run:
-                dest_dir = self.config.output_path / "Guide"
-                dest_dir.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(source_path, dest_dir / source_path.name)
+                _fast_copy(source_path, os.path.join(dest_dir, source_path.name))
+
+            return metadata
+
+        self.doc_registry.extend(self._map_concurrently(process, sources))
+
+        if sources:
+            self._add_to_archive(dest_dir, "Guide")
+            for metadata in self.doc_registry:
+                self._add_to_archive(metadata.path, f"Guide/{metadata.filename}")
 
         if not self.doc_registry:
             raise RuntimeError("No documentation files found. Expected structure may have changed.")
@@ -405,16 +633,31 @@ class SkillGenerator:
             logger.warning("No example files found in Sources/Examples")
             return
 
-        for source_path in example_files:
+        # Plain string paths keep Path allocations out of the per-file work
+        dest_dir = os.fspath(self.config.output_path / "Examples")
+        if not self.config.dry_run:
+            os.makedirs(dest_dir, exist_ok=True)
+
+        # Sources whose sanitized names collide share one destination; only the
+        # last one is copied, so concurrent copies never race on the same file
+        copy_sources = {sanitize_filename(path.name): path for path in example_files}
+
+        def process(source_path: Path) -> ExampleMetadata:
             # Extract Metadata
             metadata = self.parser.extract_example_metadata(source_path)
-            self.example_registry.append(metadata)
 
             # Copy File with sanitized filename
-            if not self.config.dry_run:
-                dest_dir = self.config.output_path / "Examples"
-                dest_dir.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(source_path, dest_dir / metadata.filename)
+            if not self.config.dry_run and copy_sources[metadata.filename] == source_path:
+                _fast_copy(source_path, os.path.join(dest_dir, metadata.filename))
+
+            return metadata
+
+        self.example_registry.extend(self._map_concurrently(process, example_files))
+
+        # One entry per destination name, matching what was copied
+        self._add_to_archive(dest_dir, "Examples")
+        for filename, source_path in copy_sources.items():
+            self._add_to_archive(source_path, f"Examples/{filename}")
 
         logger.info(f"Processed {len(self.example_registry)} example files")
 
@@ -428,7 +671,8 @@ class SkillGenerator:
         for name in ["LICENSE.txt", "LICENSE.md", "LICENSE"]:
             lic_path = self.repo.path / name
             if lic_path.exists():
-                shutil.copy2(lic_path, self.config.output_path / name)
+                _fast_copy(lic_path, self.config.output_path / name)
+                self._add_to_archive(lic_path, name)
                 logger.info(f"Included license: {name}")
                 return
 
@@ -444,7 +688,7 @@ class SkillGenerator:
             "understanding Sendable and actor isolation, or incrementally adopting async/await."
         )
 
-        content = [
+        header = [
             "---",
             f"name: {self.config.SKILL_NAME}",
             f"description: {desc}",
@@ -461,31 +705,31 @@ class SkillGenerator:
         ]
 
         # Documentation entries
-        for doc in self.doc_registry:
-            rel_path = f"Guide/{doc.filename}"
-            safe_desc = doc.description.replace('[', '(').replace(']', ')')
-            entry = f"- **{doc.title}** ([{rel_path}]({rel_path})): {safe_desc}"
-            content.append(entry)
-
-        content.append("")
+        doc_lines = [
+            f"- **{doc.title}** ([Guide/{doc.filename}](Guide/{doc.filename})): "
+            f"{doc.description.translate(_BRACKET_TRANS)}"
+            for doc in self.doc_registry
+        ]
 
         # Examples section
-        if self.example_registry:
-            content.append("## Code Examples")
-            content.append("")
-            content.append("Swift source files demonstrating migration patterns and concurrency concepts:")
-            content.append("")
-
-            for example in self.example_registry:
-                rel_path = f"Examples/{example.filename}"
-                safe_desc = example.description.replace('[', '(').replace(']', ')')
-                entry = f"- **{example.filename}** ([{rel_path}]({rel_path})): {safe_desc}"
-                content.append(entry)
-
-            content.append("")
+        example_lines = [
+            f"- **{example.filename}** ([Examples/{example.filename}](Examples/{example.filename})): "
+            f"{example.description.translate(_BRACKET_TRANS)}"
+            for example in self.example_registry
+        ]
+        if example_lines:
+            example_header = [
+                "## Code Examples",
+                "",
+                "Swift source files demonstrating migration patterns and concurrency concepts:",
+                ""
+            ]
+            example_footer = [""]
+        else:
+            example_header = example_footer = []
 
         # Usage Notes & License
-        content.extend([
+        footer = [
             "## Usage Notes",
             "",
             "- Start with Data Race Safety to understand the core concepts",
@@ -507,11 +751,17 @@ class SkillGenerator:
             "The structure and organization of this skill (this index file) is "
             "copyright Kyle Hughes, distributed under the MIT License.",
             ""
-        ])
+        ]
 
         # Write file
         out_file = self.config.output_path / "SKILL.md"
-        out_file.write_text('\n'.join(content), encoding='utf-8')
+        content = '\n'.join(itertools.chain(
+            header, doc_lines, [""],
+            example_header, example_lines, example_footer,
+            footer
+        ))
+        out_file.write_text(content, encoding='utf-8')
+        self._add_to_archive(out_file, "SKILL.md")
 
 
 # --- Entry Point ---
@@ -548,7 +798,8 @@ def main():
     config = Configuration.from_args(args)
 
     try:
-        with GitRepository(config.REPO_URL, config.keep_temp) as repo:
+        sparse_paths = [config.GUIDE_REL_PATH, config.EXAMPLES_REL_PATH]
+        with GitRepository(config.REPO_URL, config.keep_temp, sparse_paths) as repo:
             generator = SkillGenerator(config, repo)
             generator.build()
     except Exception as e: